@@ -18,11 +18,6 @@ class Groups:
         validator=validators.instance_of(str),
         default='groups.json')
 
-    def __init__(self, state_file='groups.json'):
-        self.controller = Controller()
-        self.state_file = state_file
-        # self.load_state()
-
     def load_state(self):
         with open(self.state_file, 'r') as f:
             state = json.load(f)
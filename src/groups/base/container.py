@@ -1,12 +1,12 @@
 from attrs import define, field, validators
-from typing import Optional, Tuple, TypeAlias, Type, override
+from typing import Callable, Optional, Tuple, TypeAlias, Type, override
 
 from .interface import BaseInterface
-from .types import BaseTypes, BaseValueType, BaseContainerType, BaseContainerTypesTuple
+from .types import BaseTypes, BaseValueType, BaseContainerType, BaseContainerTypesTuple, BaseValueTypesTuple
 from .value import BaseValue
 from .exceptions import GroupBaseContainerException
-from ..utils.crypto import MerkleTree
-from ..utils.validators import contains_sub_container, is_linear_container, is_named_container, is_base_container_type
+from ..utils.crypto import MerkleTree, SHA256Hash
+from ..utils.validators import is_linear_container, is_named_container, is_base_container_type
 
 
 def _base_container_type_converter(item: BaseContainerType | str | type) -> BaseContainerType:
@@ -19,7 +19,7 @@ def _base_container_type_converter(item: BaseContainerType | str | type) -> Base
 
     if type_from_alias is None or type_from_alias not in BaseContainerTypesTuple:
         raise GroupBaseContainerException(f"Expected a container type, but received {item}")
-    elif isinstance(item, BaseContainerType):
+    elif is_base_container_type(item):
         type_from_alias = type(item)
 
     return type_from_alias
@@ -33,36 +33,45 @@ def _base_container_converter(item: BaseContainerType) -> tuple[BaseValue]:
     exc_message = f"Expected a non-container, but received {type(item)}"
     
     if isinstance(item, (str, int, float, bool, bytes)):
-        base_values += tuple([BaseValue(item)], )
-
-    elif contains_sub_container(item):
-        raise GroupBaseContainerException(exc_message)
+        base_values = (BaseValue(item), )
 
     elif is_linear_container(item):
-        for item_ in item:
-            if is_base_container_type(item_):
-                raise GroupBaseContainerException(exc_message)
+        if any(is_base_container_type(item_) for item_ in item):
+            raise GroupBaseContainerException(exc_message)
 
-            if isinstance(item_, BaseValue):
-                base_values += tuple([item_], )
-            else:
-                base_values += tuple((BaseValue(item_), ))
+        base_values = tuple(item_ if isinstance(item_, BaseValue) else BaseValue(item_) for item_ in item)
 
     elif is_named_container(item):
-        for key, value in item.items():
-            if is_base_container_type(key) or is_base_container_type(value):
-                raise GroupBaseContainerException(exc_message)
-
-            if isinstance(value, BaseValue):
-                base_values += tuple([BaseValue(key), value])
-            else:
-                base_values += tuple([BaseValue(key), BaseValue(value)])
+        if any(is_base_container_type(key) or is_base_container_type(value) for key, value in item.items()):
+            raise GroupBaseContainerException(exc_message)
+
+        base_values = tuple(item_ if isinstance(item_, BaseValue) else BaseValue(item_) for pair in item.items() for item_ in pair)
     else:
         raise GroupBaseContainerException(f"Expected a container, but received a non-container {type(item)}")
 
     return base_values
 
 
+def _unpack_dict(item: tuple[BaseValue, ...]) -> dict:
+    """
+    Repackages alternating key, value items into a dict
+    """
+    items = iter(item)
+    return {key.value: value.value for key, value in zip(items, items)}
+
+
+_UNPACK: dict[type, Callable[[tuple[BaseValue, ...]], BaseContainerType]] = {
+    list: lambda item: [value.value for value in item],
+    tuple: lambda item: tuple(value.value for value in item),
+    set: lambda item: {value.value for value in item},
+    frozenset: lambda item: frozenset(value.value for value in item),
+    dict: _unpack_dict
+}
+
+
+_TYPE_DIGEST: dict[type, bytes] = {type_: MerkleTree._hash_func(type_.__name__.encode()) for type_ in BaseContainerTypesTuple}
+
+
 @define(frozen=True, slots=True, weakref_slot=False)
 class BaseContainer(BaseInterface):
     """The BaseContainer class holds Base Values
@@ -79,7 +88,7 @@ class BaseContainer(BaseInterface):
 
     _items: tuple[BaseValue, ...] = field(
         converter=_base_container_converter,
-        validator=validators.deep_iterable(validators.instance_of((BaseValue, BaseValueType)),
+        validator=validators.deep_iterable(validators.instance_of((BaseValue, *BaseValueTypesTuple)),
         iterable_validator=validators.instance_of(tuple))
     )
 
@@ -123,22 +132,12 @@ class BaseContainer(BaseInterface):
         Repackages the container
         """
         type_from_alias: TypeAlias | type = BaseTypes._get_type_from_alias(type_)
+        unpack = _UNPACK.get(type_from_alias)
+
+        if unpack is None:
+            raise GroupBaseContainerException(f"Expected a container, but received {type_}")
 
-        match (str(type_from_alias)):
-            case("<class 'list'>"):
-                return [value.value for value in item]
-            case("<class 'tuple'>"):
-                return tuple([value.value for value in item])
-            case("<class 'set'>"):
-                return {value.value for value in item}
-            case("<class 'frozenset'>"):
-                return frozenset({value.value for value in item})
-            case("<class 'dict'>"):
-                keys: tuple[BaseValue] = item[::2]
-                values: tuple[BaseValue] = item[1::2]
-                return {key.value: value.value for key, value in zip(keys, values)}
-            case _:
-                raise GroupBaseContainerException(f"Expected a container, but received {type_}")
+        return unpack(item)
 
     @override
     def __repr__(self) -> str:
@@ -180,37 +179,43 @@ class BaseContainer(BaseInterface):
         items: tuple | dict = getattr(self, slot_name)
 
         if is_linear_container(items):
-            for value in items:
-                yield value
+            return iter(items)
 
         elif is_named_container(items):
-            for key, value in items.items():
-                yield value
-                yield key
+            return (item_ for key, value in items.items() for item_ in (value, key))
+
+        return iter(())
 
     @override
     def __iter__(self):
-        yield from self.__iter_items__()
+        return iter(self._items)
 
-    def _hash_type(self) -> str:
+    def _hash_type(self) -> bytes:
         """Hashes the type of the BaseContainer
 
         Returns:
-            str: The hashed type of the BaseContainer
+            bytes: The raw hashed type of the BaseContainer
         """
-        return MerkleTree._hash_func(self.type)
+        type_digest: bytes | None = _TYPE_DIGEST.get(self._type)
+        if type_digest is None:
+            type_digest = _TYPE_DIGEST.setdefault(self._type, MerkleTree._hash_func(self._type.__name__.encode()))
+
+        return type_digest
 
-    def _hash_items(self) -> MerkleTree:
+    def _hash_items(self, store_levels: bool = True) -> MerkleTree:
         """Hashes the items of the BaseContainer
+
+        The raw item roots are passed as SHA256Hash leaves, so they are not hashed again.
+
+        Args:
+            store_levels (bool): Whether the tree keeps every level, only the root is needed to hash the BaseContainer. Defaults to True.
         
         Returns:
             MerkleTree: The hashed items of the BaseContainer
         """
-        hashed_items: tuple[str, ...] = ()
-        for item in self.__iter_items__():
-            hashed_items = hashed_items + (item._hash().root(), )
+        hashed_items: tuple[SHA256Hash, ...] = tuple(SHA256Hash(item._hash().raw_root) for item in self.__iter_items__())
 
-        return MerkleTree(hashed_items)
+        return MerkleTree(hashed_items, store_levels=store_levels)
 
     def _hash(self) -> MerkleTree:
         """Hashes the BaseContainer
@@ -218,7 +223,11 @@ class BaseContainer(BaseInterface):
         Returns:
             MerkleTree: The hashed BaseContainer
         """
-        return MerkleTree((self._hash_type(), self._hash_items().root(), ))
+        hashed_items_root: bytes | None = self._hash_items(store_levels=False).raw_root
+        if hashed_items_root is None:
+            return MerkleTree((SHA256Hash(self._hash_type()), ))
+
+        return MerkleTree((SHA256Hash(self._hash_type()), SHA256Hash(hashed_items_root), ))
 
     def _verify_item(self, item: BaseValue) -> bool:
         """Verifies the item of the BaseContainer
@@ -231,7 +240,7 @@ class BaseContainer(BaseInterface):
         """
         assert isinstance(item, BaseValue), f"Expected a BaseValue, but received {type(item)}"
 
-        leaf_hash: str | None = item._hash().root()
+        leaf_hash: bytes | None = item._hash().raw_root
         tree = self._hash_items()
 
         return tree.verify(leaf_hash)
@@ -244,13 +253,12 @@ class BaseContainer(BaseInterface):
     
     @classmethod
     def _from_dict(cls, _dict: dict) -> 'BaseContainer':
-        container_tuple: tuple[BaseValue, ...] = tuple()
         if _dict is None:
             return BaseContainer(("null", ), "tuple")
         # for item in _dict["items"]:
         #     assert isinstance(item, dict), f"Expected a dict, but received {type(item)}"
         #     assert "value" in item, f"Expected a value, but received {item}"
         #     assert "type" in item, f"Expected a type, but received {item}"
-        container_tuple += tuple(BaseValue._from_dict(item) for item in _dict["items"])
+        container_tuple: tuple[BaseValue, ...] = tuple(map(BaseValue._from_dict, _dict["items"]))
 
-        return cls(tuple(BaseValue._from_dict(item) for item in _dict["items"]), _dict["type"] if isinstance(_dict["type"], str) else _dict["type"].__name__)
\ No newline at end of file
+        return cls(container_tuple, _dict["type"] if isinstance(_dict["type"], str) else _dict["type"].__name__)
\ No newline at end of file
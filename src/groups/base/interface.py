@@ -11,6 +11,8 @@ NOTES:
         4. Slots are named in two ways:
             a. Public Slots -> begin with a lowercase letter.
             b. Private Slots -> prefixed with an underscore ("_").
+            c. Cache Slots -> fields declared with CACHE_METADATA (see utils.cache), they hold values derived from the other
+               slots and are left out of iteration, representation, and hashing.
 
     B. ITERATION DUNDER METHOD
         1. __iter__ should iterate over all slots (including private slots).
@@ -100,13 +102,34 @@ NOTES:
             e. Finally, the public and private trees are hashed together into a tree representing the package.
 
 """
+import functools
 from abc import ABC
 from attrs import define
 
 from .exceptions import GroupBaseException
+from ..utils.cache import CACHE_METADATA
 from ..utils.crypto import MerkleTree
 
 
+@functools.lru_cache(maxsize=None)
+def _slot_names(cls: type, include_underscored_slots: bool, private_only: bool) -> tuple[str, ...]:
+    """
+    Selects the slot names of a class, slots are fixed at class creation so the selection is cached per class
+    """
+    if not include_underscored_slots and private_only:
+        raise ValueError("Cannot exclude underscored slots and only include private slots.  Private slots are prefixed with an underscore (\"_\").")
+
+    cache_slots: frozenset[str] = frozenset(
+        attribute.name for attribute in getattr(cls, "__attrs_attrs__", ()) if attribute.metadata == CACHE_METADATA)
+    slots: tuple[str, ...] = tuple(slot for slot in cls.__slots__ if slot not in cache_slots)
+
+    if private_only:
+        return tuple(slot for slot in slots if slot.startswith("_"))
+    if not include_underscored_slots:
+        return tuple(slot for slot in slots if not slot.startswith("_"))
+    return slots
+
+
 @define(frozen=True, slots=True, weakref_slot=False)
 class BaseInterface(ABC):
     """
@@ -115,18 +138,7 @@ class BaseInterface(ABC):
 
     def __iter_slots__(self, include_underscored_slots: bool = False, private_only: bool = False):
         """Returns an iterator over all slots."""
-        if not include_underscored_slots and private_only:
-            raise ValueError("Cannot exclude underscored slots and only include private slots.  Private slots are prefixed with an underscore (\"_\").")
-
-        for slot in self.__slots__:
-            if private_only:
-                if slot.startswith("_"):
-                    yield slot
-            else:
-                if not include_underscored_slots and slot.startswith("_"):
-                    continue
-                else:
-                    yield slot
+        return iter(_slot_names(type(self), include_underscored_slots, private_only))
 
     def __iter__(self):
         """Returns an iterator over all slots.
@@ -134,7 +146,7 @@ class BaseInterface(ABC):
         Returns:
             Iterator[str]: An iterator over all slots.
         """
-        yield from self.__iter_slots__(include_underscored_slots=True, private_only=False)
+        return iter(_slot_names(type(self), True, False))
 
     def __repr_private__(self, include_underscored_slots: bool = True, private_only: bool = False) -> str:
         """Returns a string representation of the object in a standard format.
@@ -207,11 +219,7 @@ class BaseInterface(ABC):
             >>> BaseInterfaceExample().__str_private__()
             'test_property: 1, _private_test_property: 2'
         """
-        slot_string: str = ""
-        for slot in self.__iter_slots__(include_underscored_slots, private_only):
-            slot_string += f"{self.__str_item__(slot)}, "
-
-        return slot_string[:-2] if len(slot_string) > 0 else slot_string
+        return ", ".join(self.__str_item__(slot) for slot in self.__iter_slots__(include_underscored_slots, private_only))
 
     def __str__(self) -> str:
         """Returns a string of key-value pairs of slots and their values.
@@ -246,11 +254,7 @@ class BaseInterface(ABC):
             str: The hash of the representation of the object.
 
         """
-        hashed_slots: tuple[str] = ()
-        for slot in self.__iter_slots__(include_underscored_slots, private_only):
-            hashed_slots = hashed_slots + (self._hash_slot(slot), )
-
-        return hashed_slots
+        return tuple(self._hash_slot(slot) for slot in self.__iter_slots__(include_underscored_slots, private_only))
 
     def _hash_tree(self, include_underscored_slots: bool = True, private_only: bool = False) -> MerkleTree:
         """Returns the hash of the full representation of the object.
@@ -295,8 +299,8 @@ class BaseInterface(ABC):
             str: The hash of the representation of the object.
 
         """
-        public_hash: str | None = self._hash_public_slots().root()
-        private_hash: str | None = self._hash_private_slots().root()
+        public_hash: str | None = self._hash_public_slots().root
+        private_hash: str | None = self._hash_private_slots().root
 
         if self._check_for_none(public_hash) and self._check_for_none(private_hash):
             raise GroupBaseException("Cannot hash a package with no public or private slots.")
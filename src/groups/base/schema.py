@@ -4,12 +4,15 @@ The Schema declares the structure of the Group Unit Data.
 
 """
 
+from collections import Counter
 from attrs import define, field, validators
-from typing import TypeAlias, override, Tuple
+from typing import TypeAlias, override, Tuple, Optional
 
 from .interface import BaseInterface
 from .types import BaseTypes, BaseContainerType
+from ..utils.cache import cache_field, cached_slot
 from ..utils.crypto import MerkleTree
+from ..utils.validators import is_base_container_type
 
 
 def _validate_schema_entry_key(instance, attribute, value):
@@ -26,20 +29,12 @@ def _validate_schema_entry_key(instance, attribute, value):
     if not isinstance(value, str):
         raise TypeError(f"Expected a str, but received {type(value)}")
 
-    split_key: tuple[str, ...] = tuple(value.split(' '), )
-    if len(split_key) > 1:
+    if ' ' in value or len(value) == 0:
         raise TypeError(f"Expected a str without spaces, but received {value}")
-    
-    if len(split_key) == 1 and len(split_key[0]) == 0:
-        raise TypeError(f"Expected a str without spaces, but received {value}")
-    
-    if len(split_key) == 1 and len(split_key[0]) > 0:
-        if split_key[0] == '':
-            raise TypeError(f"Expected a non empty str, but received {value}")
 
-        if len(split_key[0]) > 256:
-            raise TypeError(f"Expected a str with length 256 or less, but received len={len(split_key[0])}, value={value}")
-        return split_key[0]
+    if len(value) > 256:
+        raise TypeError(f"Expected a str with length 256 or less, but received len={len(value)}, value={value}")
+    return value
     
 
 def _base_type_converter(item: str | type) -> TypeAlias | type:
@@ -59,7 +54,7 @@ def _base_type_converter(item: str | type) -> TypeAlias | type:
     elif isinstance(item, type):
         type_from_alias = item
 
-    elif isinstance(item, BaseContainerType):
+    elif is_base_container_type(item):
         type_from_alias = item.__class__
 
     return type_from_alias
@@ -156,26 +151,17 @@ class SchemaEntry(BaseInterface):
         return cls(key=_dict['key'], value=_dict['value'])
     
 
-def _key_is_duplicate(key: str, entries: Tuple[SchemaEntry, ...]) -> bool:
-    """Checks if the key is in the entries
+def _count_keys(entries: Tuple[SchemaEntry, ...]) -> Counter:
+    """Counts how many entries hold each key
 
     Args:
-        key (str): The key to check
-        entries (Tuple[SchemaEntry, ...]): The entries to check
+        entries (Tuple[SchemaEntry, ...]): The entries to count
 
     Returns:
-        bool: True if the key is in the entries, False otherwise
+        Counter: The number of entries per key
     """
-    single_instance: bool = True
-    instance_count: int = 0
+    return Counter(entry._key for entry in entries)
 
-    for entry in entries:
-        if entry._key == key:
-            instance_count += 1
-            if instance_count > 1:
-                single_instance = False
-                break
-    return not single_instance
 
 def _validate_schema_entries(instance, attribute, value):
     """Validates the argument is a Tuple of SchemaEntry
@@ -191,12 +177,14 @@ def _validate_schema_entries(instance, attribute, value):
     if not isinstance(value, Tuple):
         raise TypeError(f"Expected a Tuple, but received {type(value)}")
 
+    key_counts: Counter | None = None
     for item in value:
         if not isinstance(item, SchemaEntry):
             raise TypeError(f"Expected a Tuple of SchemaEntry, but received {type(value)}")
-        if _key_is_duplicate(item._key, value):
+        if key_counts is None:
+            key_counts = _count_keys(value)
+        if key_counts[item._key] > 1:
             raise TypeError(f"Expected a Tuple of SchemaEntry with unique keys, but received {value}")
-            
 
 
 @define(frozen=True, slots=True, weakref_slot=False)
@@ -215,6 +203,9 @@ class BaseSchema(BaseInterface):
     _entries: Tuple[SchemaEntry, ...] = field(
         validator=_validate_schema_entries)
 
+    _entry_index: Optional[dict[str, SchemaEntry]] = cache_field()
+    _entry_type_strs: Optional[Tuple[str, ...]] = cache_field()
+
     @property
     def entries(self) -> Tuple[SchemaEntry, ...]:
         """The entries held by the BaseSchema Class
@@ -243,17 +234,40 @@ class BaseSchema(BaseInterface):
             >>> schema.get_entry('name')
             SchemaEntry(key='name', value=str)
         """
-        for entry in self.entries:
-            if entry._key == key:
-                return entry
-        raise KeyError(f"Key {key} not found in schema")
+        entry: SchemaEntry | None = self._get_entry_index().get(key)
+        if entry is None:
+            raise KeyError(f"Key {key} not found in schema")
+        return entry
+
+    @cached_slot("_entry_index")
+    def _get_entry_index(self) -> dict[str, SchemaEntry]:
+        """Maps each key to its entry, keys are unique so every lookup is a single dict probe
+
+        Returns:
+            dict[str, SchemaEntry]: The entry of each key
+        """
+        return {entry._key: entry for entry in self._entries}
+
+    @cached_slot("_entry_type_strs")
+    def _get_entry_type_strs(self) -> Tuple[str, ...]:
+        """Gets the type string of each entry in the schema
+
+        Returns:
+            Tuple[str, ...]: The type strings of the entries
+
+        Examples:
+            >>> schema = BaseSchema((SchemaEntry(key='name', value=str), SchemaEntry(key='age', value=int)))
+            >>> schema._get_entry_type_strs()
+            ('str', 'int')
+        """
+        return tuple(SchemaEntry._str_value(entry._value) for entry in self._entries)
     
     @override
     def __iter__(self):
         """Iterates over the entries in the schema
 
-        Yields:
-            SchemaEntry: The entries in the schema
+        Returns:
+            Iterator[SchemaEntry]: An iterator over the entries in the schema
         
         Examples:
             >>> schema = BaseSchema((SchemaEntry(key='name', value=str), SchemaEntry(key='age', value=int)))
@@ -262,8 +276,7 @@ class BaseSchema(BaseInterface):
             key='name', value=str
             key='age', value=int
         """
-        for entry in self.entries:
-            yield entry
+        return iter(self._entries)
 
     @override
     def __str__(self) -> str:
@@ -294,10 +307,8 @@ class BaseSchema(BaseInterface):
             >>> schema._hash_entries()
             MerkleTree(hashed_data=('fbc595a11273e6f79f13f9210d7d60660c8ad127aa6b870b841c4b2a8ff75cb2', '5422c43fc239d7228d8aca8f9310bca3ce00cea3256adb0db595a2b1c211a7e4'))
         """
-        hashed_entries: Tuple[str | None, ...] = tuple()
-        for entry in self.entries:
-            hashed_entries += (entry._hash().root(), )
-            
+        hashed_entries: Tuple[str | None, ...] = tuple(entry._hash().root for entry in self.entries)
+
         return MerkleTree(hashed_data=hashed_entries)
     
     def _to_dict(self):
@@ -307,4 +318,4 @@ class BaseSchema(BaseInterface):
     
     @classmethod
     def _from_dict(cls, _dict: dict) -> 'BaseSchema':
-        return cls(entries=tuple(SchemaEntry._from_dict(entry) for entry in _dict['entries']))
+        return cls(entries=tuple(map(SchemaEntry._from_dict, _dict['entries'])))
@@ -1,17 +1,52 @@
+import itertools
 from abc import ABC
 from enum import Enum
-from attrs import define, field, validators
+from attrs import define, field, validators, Factory
 from types import NoneType
 from typing import Any, Union, TypeAlias, TypeVar, Type, Tuple, Optional, Callable, override, List, Set, FrozenSet, Dict
 
 from .interface import BaseInterface
 from .exceptions import GroupBaseTypeException
+from ..utils.cache import CACHE_METADATA, cache_field, cached_slot
 from ..utils.crypto import MerkleTree
 
 
-@define(frozen=True, slots=True, weakref_slot=False)
+# Category results of BaseTypes.all keyed by its arguments, filled once at import as the system types are fixed
+_ALL_TYPES: dict[tuple[Optional[str], Optional[str]], Union[type | TypeAlias, tuple[type | TypeAlias, ...]]] = {}
+_ALL_TYPE_CATEGORIES: tuple[str, ...] = ("value", "container", "linear", "named", "text", "number")
+_ALL_TYPE_FORMATS: tuple[str, ...] = ("tuple", "union")
+
+
+def _validate_aliases(instance, attribute, value) -> None:
+    """
+    Validator function for aliases field, checks the tuple and its items in one pass
+    """
+    if not isinstance(value, tuple) or not all(type(alias) is str for alias in value):
+        raise TypeError(f"Expected {attribute.name} to be a tuple of str, but received {value}")
+
+
+def _build_separators(separator: Optional[str]) -> Tuple[str, ...]:
+    """
+    Builds the padded variants of a separator, computed once per base type
+    """
+    if separator is None:
+        return ()
+    return (separator, f" {separator}", f"{separator} ", f" {separator} ")
+
+
+def _build_super_type_set(super_type: Optional[str | type | Tuple[str, ...]]) -> frozenset[str | type]:
+    """
+    Normalizes the super type to a set, so super type checks are membership rather than substring tests
+    """
+    if super_type is None:
+        return frozenset()
+    if isinstance(super_type, tuple):
+        return frozenset(super_type)
+    return frozenset((super_type, ))
+
+
+@define(frozen=True, slots=True, weakref_slot=False, eq=False)
 class BaseType(BaseInterface):
-# class BaseType:
     """Base class for types
     
     Args:
@@ -25,12 +60,10 @@ class BaseType(BaseInterface):
         constraints (Optional[Union[type, TypeAlias]]): The constraints for the base type
         _encryption_key (Optional[bytes]): The encryption key for the base type
     """
-    aliases: Tuple[str, ...] = field(
-        validator=validators.deep_iterable(validators.instance_of(str),
-        iterable_validator=validators.instance_of(Tuple)))
+    aliases: Tuple[str, ...] = field(validator=_validate_aliases)
 
     super_type: Optional[Tuple[str, ...]] = field(
-        validator=validators.optional(validators.instance_of((str, type))),
+        validator=validators.optional(validators.instance_of((str, type, tuple))),
         default=None)
 
     prefix: Optional[str] = field(
@@ -61,6 +94,29 @@ class BaseType(BaseInterface):
         validator=validators.optional(validators.instance_of(bytes)),
         default=None)
 
+    _alias_set: frozenset[str] = field(
+        init=False,
+        eq=False,
+        repr=False,
+        metadata=CACHE_METADATA,
+        default=Factory(lambda self: frozenset(self.aliases), takes_self=True))
+
+    _separators: Tuple[str, ...] = field(
+        init=False,
+        eq=False,
+        repr=False,
+        metadata=CACHE_METADATA,
+        default=Factory(lambda self: _build_separators(self.separator), takes_self=True))
+
+    _super_type_set: frozenset[str | type] = field(
+        init=False,
+        eq=False,
+        repr=False,
+        metadata=CACHE_METADATA,
+        default=Factory(lambda self: _build_super_type_set(self.super_type), takes_self=True))
+
+    _hash_package_root: Optional[str] = cache_field()
+
     @property
     def is_container(self) -> bool:
         """Whether the base type is a container
@@ -80,36 +136,22 @@ class BaseType(BaseInterface):
         Returns:
             Tuple[str]: The separators for the base type
         """
-        if self.separator is not None:
-            return (self.separator,)
-        return tuple(f" {self.separator}", f"{self.separator} ", f" {self.separator} ", f"{self.separator}")
+        return self._separators
         
-    def _contains(self, property: str, query: str, exclude: Optional[Tuple[str, ...]] = None) -> bool:
+    def _contains(self, property: str, query: str) -> bool:
         assert property in self.__slots__
 
         match(property):
             case("aliases"):
-                if query in self.aliases:
-                    return True
-                for alias in self.aliases:
-                    if exclude is not None:
-                        if self.aliases[0] in exclude:
-                            continue
-                    else:
-                        if alias.__contains__(query):
-                            raise GroupBaseTypeException(f"Alias {query} is a substring of {alias}, and should be removed")
+                return self._contains_alias(query)
             case("super_type"):
-                if query in self.super_type:
-                    return True
+                return self._contains_super_type(query)
             case("separator"):
-                if query in self.separators:
-                    return True
+                return self._contains_separator(query)
             case _:
-                if query == getattr(self, property):
-                    return True
-        return False
+                return query == getattr(self, property)
 
-    def _contains_alias(self, alias: str, exclude: Optional[Tuple[str, ...]] = None) -> bool:
+    def _contains_alias(self, alias: str) -> bool:
         """Checks if type contains an alias
 
         Args:
@@ -118,7 +160,29 @@ class BaseType(BaseInterface):
         Returns:
             bool: Whether the type contains an alias
         """
-        return self._contains("aliases", alias, exclude)
+        return alias in self._alias_set
+
+    def _contains_super_type(self, super_type: str) -> bool:
+        """Checks if type contains a super type
+
+        Args:
+            super_type (str): The super type to check
+
+        Returns:
+            bool: Whether the type contains the super type
+        """
+        return super_type in self._super_type_set
+
+    def _contains_separator(self, separator: str) -> bool:
+        """Checks if type contains a separator
+
+        Args:
+            separator (str): The separator to check
+
+        Returns:
+            bool: Whether the type contains the separator
+        """
+        return separator in self._separators
             
     def _check_for_errors(self) -> None:
         """Checks for errors in the base type"""
@@ -132,6 +196,15 @@ class BaseType(BaseInterface):
         if self.prefix is not None and self.suffix is None and self.separator is not None:
             raise GroupBaseTypeException(f"Seperator cannot be used if prefix is not None and suffix is None: {self.separator}")
         
+    @cached_slot("_hash_package_root")
+    def _package_root(self) -> str:
+        """The root of the hash package of the base type, computed once per base type
+
+        Returns:
+            str: The root of the hash package
+        """
+        return self._hash_package().root
+
     def _type_to_string(self, type_: TypeAlias | type) -> str:
         """Converts a type to a string
 
@@ -162,144 +235,182 @@ class BaseType(BaseInterface):
         """
         return super().__repr_private__(include_underscored_slots=False)
     
+    @override
+    def __eq__(self, other: Any) -> bool:
+        """Compares base types by identity, the system types are singletons
 
-@define(frozen=True, slots=True, weakref_slot=False)
+        Returns:
+            bool: True if both are the same base type
+        """
+        return self is other
+
+    @override
+    def __hash__(self) -> int:
+        """Hashes by identity, so dict and set lookups do not hash every field
+
+        Returns:
+            int: The identity hash
+        """
+        return object.__hash__(self)
+
+
+# The system types are module constants, every _BaseTypes instance shares the same frozen BaseType objects
+_INTEGER_TYPE: BaseType = BaseType(
+    aliases=(
+        "Integer", "integer", "INTEGER",
+        "Int", "int", "INT",
+        "IntegerType", "integer_type", "INTEGER_TYPE",
+        "IntType", "int_type", "INT_TYPE"
+    ),
+    super_type="__SYSTEM_RESERVED_INT__",
+    type_class=int,
+    type_var=TypeVar('Integer', bound=int),
+    constraints=int
+)
+
+_FLOATING_POINT_TYPE: BaseType = BaseType(
+    aliases=(
+        "FloatingPoint", "floating_point", "FLOATING_POINT",
+        "Float", "float", "FLOAT",
+        "FloatingPointType", "floating_point_type", "FLOATING_POINT_TYPE",
+        "FloatType", "float_type", "FLOAT_TYPE"
+    ),
+    super_type="__SYSTEM_RESERVED_FLOAT__",
+    type_class=float,
+    type_var=TypeVar('FloatingPoint', bound=float),
+    constraints=float
+)
+
+_BOOLEAN_TYPE: BaseType = BaseType(
+    aliases=(
+        "Boolean", "boolean", "BOOLEAN",
+        "Bool", "bool", "BOOL",
+        "BooleanType", "boolean_type", "BOOLEAN_TYPE",
+        "BoolType", "bool_type", "BOOL_TYPE"
+    ),
+    super_type="__SYSTEM_RESERVED_BOOL__",
+    type_class=bool,
+    type_var=TypeVar('Boolean', bound=bool),
+    constraints=bool
+)
+
+_STRING_TYPE: BaseType = BaseType(
+    aliases=(
+        "String", "string", "STRING",
+        "Str", "str", "STR",
+        "StringType", "string_type", "STRING_TYPE",
+        "StrType", "str_type", "STR_TYPE"
+    ),
+    super_type="__SYSTEM_RESERVED_STR__",
+    type_class=str,
+    type_var=TypeVar('String', bound=str),
+    constraints=str
+)
+
+_BYTES_TYPE: BaseType = BaseType(
+    aliases=(
+        "Bytes", "bytes", "BYTES",
+        "BytesType", "bytes_type", "BYTES_TYPE"
+    ),
+    super_type="__SYSTEM_RESERVED_BYTES__",
+    type_class=bytes,
+    type_var=TypeVar('Bytes', bound=bytes),
+    constraints=bytes
+)
+
+_DICTIONARY_TYPE: BaseType = BaseType(
+    aliases=(
+        "Dictionary", "dictionary", "DICTIONARY",
+        "Dict", "dict", "DICT",
+        "DictType", "dict_type", "DICT_TYPE"
+    ),
+    super_type="__SYSTEM_RESERVED_DICT__",
+    prefix="{",
+    suffix="}",
+    separator=",",
+    type_class=dict,
+    type_var=TypeVar('Dictionary', bound=dict),
+    constraints=dict
+)
+
+_LIST_TYPE: BaseType = BaseType(
+    aliases=(
+        "List", "list", "LIST",
+        "ListType", "list_type", "LIST_TYPE"
+    ),
+    super_type="__SYSTEM_RESERVED_LIST__",
+    prefix="[",
+    suffix="]",
+    separator=",",
+    type_class=list,
+    type_var=TypeVar('List', bound=list),
+    constraints=list
+)
+
+_TUPLE_TYPE: BaseType = BaseType(
+    aliases=(
+        "Tuple", "tuple", "TUPLE",
+        "TupleType", "tuple_type", "TUPLE_TYPE"
+    ),
+    super_type="__SYSTEM_RESERVED_TUPLE__",
+    prefix="(",
+    suffix=")",
+    separator=",",
+    type_class=tuple,
+    type_var=TypeVar('Tuple', bound=tuple),
+    constraints=tuple
+)
+
+_SET_TYPE: BaseType = BaseType(
+    aliases=(
+        "Set", "set", "SET",
+        "SetType", "set_type", "SET_TYPE"
+    ),
+    super_type="__SYSTEM_RESERVED_SET__",
+    prefix="{",
+    suffix="}",
+    separator=",",
+    type_class=set,
+    type_var=TypeVar('Set', bound=set),
+    constraints=set
+)
+
+_FROZENSET_TYPE: BaseType = BaseType(
+    aliases=(
+        "FrozenSet", "frozenset", "FROZENSET",
+        "FrozenSetType", "frozenset_type", "FROZENSET_TYPE"
+    ),
+    super_type="__SYSTEM_RESERVED_FROZENSET__",
+    prefix="{",
+    suffix="}",
+    separator=",",
+    type_class=frozenset,
+    type_var=TypeVar('FrozenSet', bound=frozenset),
+    constraints=frozenset
+)
+
+
+@define(frozen=True, slots=True, weakref_slot=False, eq=False)
 class _BaseTypes(BaseInterface):
-# class _BaseTypes:
-    Integer: BaseType = field(default=BaseType(
-        aliases=(
-            str("Integer"), "integer", "INTEGER",
-            str("Int"), str("int"), "INT",
-            "IntegerType", "integer_type", "INTEGER_TYPE",
-            "IntType", "int_type", "INT_TYPE"
-        ),
-        super_type="__SYSTEM_RESERVED_INT__",
-        type_class=int,
-        type_var=TypeVar('Integer', bound=int),
-        constraints=int
-    ))
-
-    FloatingPoint: BaseType = field(default=BaseType(
-        aliases=(
-            str("FloatingPoint"), "floating_point", "FLOATING_POINT",
-            str("Float"), str("float"), "FLOAT",
-            "FloatingPointType", "floating_point_type", "FLOATING_POINT_TYPE",
-            "FloatType", "float_type", "FLOAT_TYPE"
-        ),
-        super_type="__SYSTEM_RESERVED_FLOAT__",
-        type_class=float,
-        type_var=TypeVar('FloatingPoint', bound=float),
-        constraints=float
-    ))
-
-    Boolean: BaseType = field(default=BaseType(
-        aliases=(
-            str("Boolean"), "boolean", "BOOLEAN",
-            str("Bool"), str("bool"), "BOOL",
-            "BooleanType", "boolean_type", "BOOLEAN_TYPE",
-            "BoolType", "bool_type", "BOOL_TYPE"
-        ),
-        super_type="__SYSTEM_RESERVED_BOOL__",
-        type_class=bool,
-        type_var=TypeVar('Boolean', bound=bool),
-        constraints=bool
-    ))
-
-    String: BaseType = field(default=BaseType(
-        aliases=(
-            str("String"), "string", "STRING",
-            str("Str"), str("str"), "STR",
-            "StringType", "string_type", "STRING_TYPE",
-            "StrType", "str_type", "STR_TYPE"
-        ),
-        super_type="__SYSTEM_RESERVED_STR__",
-        type_class=str,
-        type_var=TypeVar('String', bound=str),
-        constraints=str
-    ))
-
-    Bytes: BaseType = field(default=BaseType(
-        aliases=(
-            str("Bytes"), "bytes", "BYTES",
-            "BytesType", "bytes_type", "BYTES_TYPE"
-        ),
-        super_type="__SYSTEM_RESERVED_BYTES__",
-        type_class=bytes,
-        type_var=TypeVar('Bytes', bound=bytes),
-        constraints=bytes
-    ))
-
-    Dictionary: BaseType = field(default=BaseType(
-        aliases=(
-            str("Dictionary"), "dictionary", "DICTIONARY",
-            str("Dict"), str("dict"), "DICT",
-            # "DictionaryType", "dictionary_type", "DICTIONARY_TYPE",
-            "DictType", "dict_type", "DICT_TYPE"
-        ),
-        super_type="__SYSTEM_RESERVED_DICT__",
-        prefix="{",
-        suffix="}",
-        separator=",",
-        type_class=dict,
-        type_var=TypeVar('Dictionary', bound=dict),
-        constraints=dict
-    ))
-
-    List: BaseType = field(default=BaseType(
-        aliases=(
-            str("List"), "list", "LIST",
-            "ListType", "list_type", "LIST_TYPE"
-        ),
-        super_type="__SYSTEM_RESERVED_LIST__",
-        prefix="[",
-        suffix="]",
-        separator=",",
-        type_class=list,
-        type_var=TypeVar('List', bound=list),
-        constraints=list
-    ))
-
-    Tuple: BaseType = field(default=BaseType(
-        aliases=(
-            str("Tuple"), "tuple", "TUPLE",
-            "TupleType", "tuple_type", "TUPLE_TYPE"
-        ),
-        super_type="__SYSTEM_RESERVED_TUPLE__",
-        prefix="(",
-        suffix=")",
-        separator=",",
-        type_class=tuple,
-        type_var=TypeVar('Tuple', bound=tuple),
-        constraints=tuple
-    ))
-
-    Set: BaseType = field(default=BaseType(
-        aliases=(
-            str("Set"), "set", "SET",
-            "SetType", "set_type", "SET_TYPE"
-        ),
-        super_type="__SYSTEM_RESERVED_SET__",
-        prefix="{",
-        suffix="}",
-        separator=",",
-        type_class=set,
-        type_var=TypeVar('Set', bound=set),
-        constraints=set
-    ))
-
-    FrozenSet: BaseType = field(default=BaseType(
-        aliases=(
-            str("FrozenSet"), "frozenset", "FROZENSET",
-            "FrozenSetType", "frozenset_type", "FROZENSET_TYPE"
-        ),
-        super_type="__SYSTEM_RESERVED_FROZENSET__",
-        prefix="{",
-        suffix="}",
-        separator=",",
-        type_class=frozenset,
-        type_var=TypeVar('FrozenSet', bound=frozenset),
-        constraints=frozenset
-    ))
+    Integer: BaseType = field(default=_INTEGER_TYPE)
+
+    FloatingPoint: BaseType = field(default=_FLOATING_POINT_TYPE)
+
+    Boolean: BaseType = field(default=_BOOLEAN_TYPE)
+
+    String: BaseType = field(default=_STRING_TYPE)
+
+    Bytes: BaseType = field(default=_BYTES_TYPE)
+
+    Dictionary: BaseType = field(default=_DICTIONARY_TYPE)
+
+    List: BaseType = field(default=_LIST_TYPE)
+
+    Tuple: BaseType = field(default=_TUPLE_TYPE)
+
+    Set: BaseType = field(default=_SET_TYPE)
+
+    FrozenSet: BaseType = field(default=_FROZENSET_TYPE)
 
     def all(self, type_: Optional[str] = None, format_: Optional[str] = None) -> Union[type | TypeAlias, tuple[type | TypeAlias, ...]]:
         """All the system types
@@ -307,8 +418,13 @@ class _BaseTypes(BaseInterface):
         Returns:
             type | TypeAlias: All the system types
         """
-        assert type_ in ["value", "container", "linear", "named", "text", "number"] or type_ is None
-        assert format_ in ["tuple", "union"] or format_ is None
+        if self is BaseTypes:
+            all_types = _ALL_TYPES.get((type_, format_))
+            if all_types is not None:
+                return all_types
+
+        assert type_ in _ALL_TYPE_CATEGORIES or type_ is None
+        assert format_ in _ALL_TYPE_FORMATS or format_ is None
 
         if type_ is None:
             type_ = "all"
@@ -316,6 +432,14 @@ class _BaseTypes(BaseInterface):
         if format_ is None:
             format_ = "union"
 
+        return self._all(type_, format_)
+
+    def _all(self, type_: str, format_: str) -> Union[type | TypeAlias, tuple[type | TypeAlias, ...]]:
+        """Builds the system types of a category in the requested format
+
+        Returns:
+            type | TypeAlias: The system types of the category
+        """
         match (type_, format_):
             case ("value", "union"):
                 return Union[
@@ -333,7 +457,7 @@ class _BaseTypes(BaseInterface):
                     self.Boolean.type_class,
                     self.String.type_class,
                     self.Bytes.type_class,
-                    None,
+                    NoneType,
                 )
             case ("text", "union"):
                 return Union[
@@ -347,7 +471,7 @@ class _BaseTypes(BaseInterface):
                     self.String.type_class,
                     self.Bytes.type_class,
                     self.Boolean.type_class,
-                    None,
+                    NoneType,
                 )
             case ("number", "union"):
                 return Union[
@@ -419,16 +543,30 @@ class _BaseTypes(BaseInterface):
                     self.Tuple.type_class,
                     self.Set.type_class,
                     self.FrozenSet.type_class,
-                    None,
+                    NoneType,
                 )
 
+    @override
+    def __eq__(self, other: Any) -> bool:
+        """Compares base type pools by identity, the system types are singletons
+
+        Returns:
+            bool: True if both are the same base type pool
+        """
+        return self is other
+
+    @override
+    def __hash__(self) -> int:
+        """Hashes by identity, so dict and set lookups do not hash every field
+
+        Returns:
+            int: The identity hash
+        """
+        return object.__hash__(self)
+
     @property
     def all_base_types(self) -> tuple[BaseType, ...]:
-        system_types: Tuple[BaseType, ...] = ()
-        for slot in self.__slots__:
-            base_type: BaseType = getattr(self, slot)
-            system_types += (base_type,)
-        return system_types
+        return tuple(map(self.__getattribute__, self.__slots__))
 
     @property
     def value_types(self) -> type | TypeAlias:
@@ -445,10 +583,7 @@ class _BaseTypes(BaseInterface):
         Returns:
             tuple[str, ...]: All the aliases for the base types
         """
-        aliases: Tuple[str, ...] = ()
-        for base_type in self.all_base_types:
-            aliases += base_type.aliases
-        return aliases
+        return tuple(itertools.chain.from_iterable(base_type.aliases for base_type in self.all_base_types))
 
     def _already_exists(self, property: str, query_value: str) -> bool:
         """Checks if a property of a base type already exists
@@ -472,25 +607,53 @@ class _BaseTypes(BaseInterface):
     def _validate_types(self) -> bool:
         """Validates the types of the base types
         """
+        # One pass over the base types, the first owner of every type_class and alias is recorded
+        type_class_owners: dict[str, BaseType] = {}
+        alias_owners: dict[str, BaseType] = {}
+
         for base_type in self.all_base_types:
 
             # Check for errors in the base type
             base_type._check_for_errors()
 
-            # Check if certain properties of the base type already exist
-            # Base Types cannot share the same aliases ("int" and "set" are excluded from throwing an error, as they clash with FloatingPoint and FrozenSet)
             # Base Types cannot share the same type_class
-            for base_type_ in self.all_base_types:
-                if base_type is not base_type_:
-                    # Check that the type_class is not already used
-                    if base_type._type_to_string(base_type.type_class) == base_type_._type_to_string(base_type_.type_class):
-                        raise GroupBaseTypeException(f"Type {base_type.type_class} is already used by {base_type_}")
-                    
-                    # Check that the aliases are not already used
-                    for alias in base_type.aliases:
-                        # system reserved types "int" and "set" are excluded from throwing an error
-                        if base_type_._contains_alias(alias, exclude=("int", "INT", str("Set"), str("set"), "SET")):
-                            raise GroupBaseTypeException(f"Alias {alias} is already used by {base_type_}")
+            type_class: str = base_type._type_to_string(base_type.type_class)
+            owner: BaseType = type_class_owners.setdefault(type_class, base_type)
+            if owner is not base_type:
+                raise GroupBaseTypeException(f"Type {base_type.type_class} is already used by {owner.aliases[0]}")
+
+            # Base Types cannot share the same aliases
+            for alias in base_type.aliases:
+                owner = alias_owners.setdefault(alias, base_type)
+                if owner is not base_type:
+                    raise GroupBaseTypeException(f"Alias {alias} is already used by {owner.aliases[0]}")
+
+        # system reserved types "int" and "set" are excluded from throwing an error, as they clash with FloatingPoint and FrozenSet
+        return self._validate_no_substring_aliases(exclude=("int", "INT", "Set", "set", "SET"))
+
+    def _validate_no_substring_aliases(self, exclude: tuple[str, ...] = ()) -> bool:
+        """Validates that no alias is a substring of an alias of another base type
+
+        Args:
+            exclude (tuple[str, ...]): Base types holding any of these aliases are not checked
+
+        Raises:
+            GroupBaseTypeException: If an alias is a substring of an alias of another base type
+
+        Returns:
+            bool: True if no alias is a substring of an alias of another base type
+        """
+        for base_type in self.all_base_types:
+            if not base_type._alias_set.isdisjoint(exclude):
+                continue
+
+            # One joined string per base type lets each alias be checked with a single C-level substring search
+            other_aliases: str = "\0".join(
+                alias for base_type_ in self.all_base_types if base_type_ is not base_type for alias in base_type_.aliases)
+
+            for alias in base_type.aliases:
+                if alias in other_aliases:
+                    raise GroupBaseTypeException(f"Alias {alias} of {base_type.aliases[0]} is a substring of an alias of another base type, and should be removed")
         return True
 
     def _get_type(self, property: str, query_value: str) -> BaseType:
@@ -504,14 +667,30 @@ class _BaseTypes(BaseInterface):
     def _get_type_from_alias(self, alias: str) -> Type:
         """Gets a base type from an alias
         """
+        if self is BaseTypes:
+            base_type: BaseType | None = _ALIAS_INDEX.get(alias)
+            if base_type is not None:
+                return base_type.type_class
+
         return self._get_type("aliases", alias).type_class
+
+    def _build_alias_index(self) -> dict[str, BaseType]:
+        """Maps every alias to its base type
+
+        Returns:
+            dict[str, BaseType]: The base type of each alias
+        """
+        alias_index: dict[str, BaseType] = {}
+        for base_type in self.all_base_types:
+            for alias in base_type.aliases:
+                # The first base type holding an alias wins, as in _get_type
+                alias_index.setdefault(alias, base_type)
+        return alias_index
     
     def _hash_types(self) -> MerkleTree:
         """Hashes the types
         """
-        hashed_types: Tuple[str, ...] = ()
-        for base_type in self.all_base_types:
-            hashed_types += (base_type._hash_package().root(),)
+        hashed_types: Tuple[str, ...] = tuple(base_type._package_root() for base_type in self.all_base_types)
         return MerkleTree(hashed_data=hashed_types)
 
 
@@ -557,6 +736,16 @@ class BaseTypeAliases(Enum):
 # Base Type Categories
 BaseTypes = _BaseTypes()
 
+# The system types are checked once at import, a clashing alias or type_class fails the import rather than a later lookup
+BaseTypes._validate_types()
+
+# The system types are fixed, so their aliases resolve with a single dict probe; misses still take the checked scan
+_ALIAS_INDEX: dict[str, BaseType] = BaseTypes._build_alias_index()
+
+_ALL_TYPES.update(
+    ((type_, format_), BaseTypes._all(type_ or "all", format_ or "union"))
+    for type_ in (None, *_ALL_TYPE_CATEGORIES) for format_ in (None, *_ALL_TYPE_FORMATS))
+
 class BaseValueTypes(Enum):
     """The BaseValueTypes Enum holds the types of the BaseValue
     """
@@ -6,7 +6,7 @@ from unittest.mock import Base
 from attrs import define, field, Factory
 
 
-from .types import BaseValueType
+from .types import BaseValueType, BaseValueTypesTuple
 from .interface import BaseInterface
 from .exceptions import GroupBaseValueException
 from ..utils.crypto import MerkleTree
@@ -18,7 +18,7 @@ __ALLOW_NONE_VALUE__ = True
 __DEFAULT_VALUE__ = "Null"
 
 
-@define(frozen=True, slots=True, weakref_slot=False)
+@define(frozen=True, slots=True, weakref_slot=False, eq=False)
 class BaseValue(BaseInterface):
     """Base class for values
 
@@ -104,7 +104,7 @@ class BaseValue(BaseInterface):
         """
         if isinstance(value, BaseValue):
             value = value.value
-        elif not isinstance(value, BaseValueType):
+        elif not isinstance(value, BaseValueTypesTuple):
             raise TypeError(f"Expected a value, but received {type(value)}")
 
         # if value is None:
@@ -129,6 +129,28 @@ class BaseValue(BaseInterface):
         """
         return type(self._value).__name__
 
+    def __eq__(self, other: Any) -> bool:
+        """Compares the held values of two BaseValues
+
+        Returns:
+            bool: True if both are BaseValues holding equal values
+
+        Examples:
+            >>> BaseValue(1) == BaseValue(1)
+            True
+        """
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._value == other._value
+
+    def __hash__(self) -> int:
+        """Hashes the held value, BaseValue has a single field so no field tuple is built
+
+        Returns:
+            int: The hash of the held value
+        """
+        return hash(self._value)
+
     @override
     def __str__(self) -> str:
         """The String of the value of the BaseValue
@@ -242,7 +264,7 @@ class BaseValue(BaseInterface):
                 >>> value._verify_hash('5b1980a185761ca08c85b7ae8d9d98176814e6161f86df9bbc0b5ae4311ba46a')
                 True
         """
-        return self._hash().root() == hash_
+        return self._hash().root == hash_
     
     def _to_dict(self) -> dict:
         return {
@@ -14,6 +14,20 @@ __DEFAULT_GROUP_UNIT__ = GroupUnit(
     Data(BaseContainer((0, ), "tuple")))
 
 
+def _default_pool() -> Pool:
+    """
+    Creates a Pool holding only the default Group Unit
+    """
+    return Pool(((__DEFAULT_GROUP_UNIT__.data._hash().root, __DEFAULT_GROUP_UNIT__.nonce._hash().root, __DEFAULT_GROUP_UNIT__),), )
+
+
+def _convert_pool(pool: Optional[Pool]) -> Pool:
+    """
+    Converter function for pool field, None is replaced by the default Pool
+    """
+    return _default_pool() if pool is None else pool
+
+
 @define(slots=True, weakref_slot=False)
 class Controller:
     """The Controller class holds a Pool of Group Units and is used to manage the Group Units
@@ -23,20 +37,13 @@ class Controller:
     """
     pool: Optional[Pool] = field(
         default=None,
-        validator=validators.optional(validators.instance_of(Pool)))
+        converter=_convert_pool,
+        validator=validators.instance_of(Pool))
     
     _active: Optional[GroupUnit] = field(
-        default=None,
+        default=Factory(lambda self: self.pool.group_units[-1][2], takes_self=True),
         validator=validators.optional(validators.instance_of(GroupUnit)))
 
-    def __init__(self, pool: Optional[Pool] = None):
-        if pool is not None:
-            self.pool = pool
-        else:
-            self.pool = Pool(((__DEFAULT_GROUP_UNIT__.data._hash().root(), __DEFAULT_GROUP_UNIT__.nonce._hash().root(), __DEFAULT_GROUP_UNIT__),), )
-
-        self._active = self.pool.group_units[-1][2]
-
     @property
     def active(self) -> GroupUnit | None:
         self._active = self.pool.group_units[-1][2]
@@ -131,7 +138,7 @@ class Controller:
         Returns:
             GroupUnit: The GroupUnit from the Pool
         """
-        return self._get_group_unit(nonce._hash().root())
+        return self._get_group_unit(nonce._hash().root)
     
     def _group_unit_from_dict(self, data: dict[str, Any]) -> GroupUnit:
         """Creates a GroupUnit from a dict
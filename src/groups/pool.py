@@ -70,14 +70,11 @@ class Pool:
 
         assert lookup in ('unit', 'nonce', 'all'), f'Expected lookup to be package_hash or nonce_hash, got {lookup}'
 
-        for hash_item in hashs:
-            # print(f'hash_item: {hash_item}')
-            for item in iter(self):
-                if item[0] == hash_item and (lookup == 'unit' or lookup == 'all'):
-                    return True
-                if item[1] == hash_item and (lookup == 'nonce' or lookup == 'all'):
-                    return True
-        return False
+        check_units: bool = lookup in ('unit', 'all')
+        check_nonces: bool = lookup in ('nonce', 'all')
+        hash_set: frozenset[str] = frozenset(hashs)
+
+        return any((check_units and item[0] in hash_set) or (check_nonces and item[1] in hash_set) for item in self)
     
     def check_if_exists(self, group_unit: GroupUnit) -> bool:
         """Check if a GroupUnit exists in the Pool
@@ -88,8 +85,8 @@ class Pool:
         Returns:
             bool: True if the GroupUnit exists in the Pool, False otherwise
         """
-        package_hash: str = group_unit.data._hash().root()
-        nonce_hash: str = group_unit.nonce._hash().root()
+        package_hash: str = group_unit.data._hash().root
+        nonce_hash: str = group_unit.nonce._hash().root
 
         return self._check_if_hash_exists((package_hash, nonce_hash), lookup='all')
     
@@ -105,8 +102,8 @@ class Pool:
         if not isinstance(group_unit, GroupUnit):
             raise TypeError(f'Expected GroupUnit, got {type(group_unit)}')
 
-        group_unit_hash: str | None = group_unit.data._hash().root()
-        nonce_hash: str | None = group_unit.nonce._hash().root()
+        group_unit_hash: str | None = group_unit.data._hash().root
+        nonce_hash: str | None = group_unit.nonce._hash().root
 
         # print(f'group_unit_hash: {group_unit_hash}, nonce_hash: {nonce_hash}')
         assert group_unit_hash is not None, f'Expected group_unit_hash to be str, got {type(group_unit_hash)}'
@@ -155,7 +152,7 @@ class Pool:
         """
         assert isinstance(nonce, Nonce), f'Expected nonce to be Nonce, got {type(nonce)}'
 
-        return self.get_group_unit(nonce._hash().root(), lookup='nonce')
+        return self.get_group_unit(nonce._hash().root, lookup='nonce')
     
     def _get_super_nonce(self, nonce: Nonce) -> Nonce:
         """Get the super Nonce of a Nonce
@@ -168,9 +165,7 @@ class Pool:
         """
         assert isinstance(nonce, Nonce), f'Expected nonce to be Nonce, got {type(nonce)}'
 
-        print(f'nonce: {nonce}')
         base_values: tuple[BaseValue, ...] = tuple(nonce._chain.items[:-1])
-        # print(f'base_values: {base_values}')
 
         return Nonce(BaseContainer(base_values))
 
@@ -181,7 +176,7 @@ class Pool:
         Returns:
             iter: An iterator over the Group Units in the Pool
         """
-        return iter(self.group_units.__iter__())
+        return iter(self.group_units)
 
     def __repr__(self):
         """Return the representation of the Pool
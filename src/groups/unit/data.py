@@ -4,10 +4,11 @@ from typing import Optional, Tuple, Any
 from ..utils.crypto import MerkleTree
 
 from ..base.value import BaseValue
-from ..base.types import BaseContainerType, BaseValueTypes, BaseValueType
+from ..base.types import BaseContainerType, BaseValueTypes, BaseValueType, BaseValueTypesTuple
 from ..base.interface import BaseInterface
 from ..base.container import BaseContainer
-from ..base.schema import BaseSchema, SchemaEntry
+from ..base.schema import BaseSchema
+from ..utils.validators import is_base_container_type
 
 
 def _convert_to_entry(item: BaseContainer | BaseValue | BaseContainerType | BaseValueTypes ) -> BaseContainer:
@@ -23,9 +24,9 @@ def _convert_to_entry(item: BaseContainer | BaseValue | BaseContainerType | Base
         return item
     elif isinstance(item, BaseValue):
         return BaseContainer((item,))
-    elif isinstance(item, BaseContainerType):
+    elif is_base_container_type(item):
         return BaseContainer(item)
-    elif isinstance(item, BaseValueType):
+    elif isinstance(item, BaseValueTypesTuple):
         return BaseContainer((BaseValue(item),))
     else:
         raise TypeError(f"Expected a BaseContainer, but received {type(item)}")
@@ -71,10 +72,7 @@ class Data(BaseInterface):
         Returns:
             Tuple[str, ...]: The types of the data entry
         """
-        types_: Tuple[str, ...] = tuple()
-        for value in data_entry.items:
-            types_ += (value.get_type_str(),)
-        return types_
+        return tuple(value.get_type_str() for value in data_entry.items)
     
     @staticmethod
     def _check_if_data_entry_matches_schema(data_entry: BaseContainer, schema_: BaseSchema) -> bool:
@@ -89,12 +87,11 @@ class Data(BaseInterface):
         """
         exc_msg = f"Expected data entry to match schema entry, but received {data_entry} and {schema_}"
 
-        i: int = 0
-        for type_ in Data._get_schema_of_data_entry(data_entry):
-            if type_ != schema_.entries[0]._str_value(schema_.entries[i]._value):
-                print(f'Expected {type_} to be {schema_.entries[0]._str_value(schema_.entries[i]._value)}')
-                raise TypeError(exc_msg)
-            i += 1
+        data_types: Tuple[str, ...] = Data._get_schema_of_data_entry(data_entry)
+        expected_types: Tuple[str, ...] = schema_._get_entry_type_strs()
+
+        if data_types != expected_types[:len(data_types)]:
+            raise TypeError(exc_msg)
         return True
     
     @classmethod
@@ -133,11 +130,8 @@ class Data(BaseInterface):
         }
     
     @classmethod
-    def _from_dict_without_schema(cls, data: dict[str, BaseContainer | BaseSchema]) -> 'Data':
-        return Data._from(
-            entry=BaseContainer._from_dict(data["entry"]),
-            schema=SchemaEntry._from_dict(data["schema"]) if data["schema"] is not None else None
-        )
+    def _from_dict_without_schema(cls, data: dict[str, BaseContainer]) -> 'Data':
+        return Data._from(entry=BaseContainer._from_dict(data["entry"]))
     
     @classmethod
     def _from_dict(cls, data: dict[str, BaseContainer | BaseSchema]) -> 'Data':
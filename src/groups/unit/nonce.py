@@ -30,7 +30,7 @@ def _validate_nonce_type(instance, attribute, value):
         if not isinstance(item_, BaseValue):
             raise GroupBaseException(f"Expected a BaseValue, but received {type(item_)}")
 
-        if not isinstance(item_.value, int | str):
+        if not isinstance(item_.value, __SUPPORTED_NONCE_TYPES__):
             raise GroupBaseException(f"Expected a supported nonce type, but received {type(item_.value)}")
 
 
@@ -53,18 +53,19 @@ class Nonce(BaseInterface):
     def _next_active(self) -> BaseValue:
         """Gets The next active nonce
         """
-        active_nonce = self._get_active()
-        if isinstance(active_nonce.value, int):
-            return BaseValue(active_nonce.value + 1)
+        active_value = self._get_active().value
+        if isinstance(active_value, int):
+            return BaseValue(active_value + 1)
 
-        elif isinstance(active_nonce.value, str):
-            if active_nonce.value[-1] == 'z':
-                return BaseValue(active_nonce.value + 'a')
-            elif active_nonce.value[-1] == 'Z':
-                return BaseValue(active_nonce.value + 'A')
+        elif isinstance(active_value, str):
+            last_char: str = active_value[-1]
+            if last_char == 'z':
+                return BaseValue(active_value + 'a')
+            elif last_char == 'Z':
+                return BaseValue(active_value + 'A')
 
-            next_char = chr(ord(active_nonce.value[-1]) + 1)
-            return BaseValue(active_nonce.value[:-1] + next_char)
+            next_char = chr(ord(last_char) + 1)
+            return BaseValue(active_value[:-1] + next_char)
 
     def _next_active_chain(self) -> BaseContainer:
         """Gets the next active chain
@@ -131,10 +132,7 @@ class Nonce(BaseInterface):
         return MerkleTree._hash_func(str(str(self)))
     
     def _hash_nonce_units(self) -> tuple[str, ...]:
-        nonce_units: tuple = ()
-        for nonce_unit in self:
-            nonce_units = nonce_units + (nonce_unit._hash().root(), )
-        return nonce_units
+        return tuple(nonce_unit._hash().root for nonce_unit in self)
     
     def _hash(self) -> MerkleTree:
         # return MerkleTree(self._hash_nonce_units())
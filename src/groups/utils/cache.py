@@ -0,0 +1,44 @@
+"""
+Lazy caches for frozen attrs classes.
+
+A cache field is a non-init slot declared with cache_field(). Its metadata marks it so BaseInterface leaves it out of
+slot iteration, representation, and hashing. A method decorated with cached_slot() fills the field on first call, the
+instance is frozen so the value stays valid for the lifetime of the instance.
+"""
+import functools
+from attrs import field
+from typing import Any, Callable, TypeVar
+
+_T = TypeVar("_T")
+
+CACHE_METADATA: dict[str, bool] = {"cache": True}
+
+
+def cache_field() -> Any:
+    """Declares an empty cache field, kept out of init, equality, repr, and the hashed slots
+
+    Returns:
+        Any: The attrs field
+    """
+    return field(init=False, eq=False, repr=False, metadata=CACHE_METADATA, default=None)
+
+
+def cached_slot(slot: str) -> Callable[[Callable[[Any], _T]], Callable[[Any], _T]]:
+    """Caches the result of a method in a cache field of a frozen instance
+
+    Args:
+        slot (str): The name of the cache field holding the result
+
+    Returns:
+        Callable: The decorator
+    """
+    def decorator(compute: Callable[[Any], _T]) -> Callable[[Any], _T]:
+        @functools.wraps(compute)
+        def wrapper(self: Any) -> _T:
+            value: _T | None = getattr(self, slot)
+            if value is None:
+                value = compute(self)
+                object.__setattr__(self, slot, value)
+            return value
+        return wrapper
+    return decorator
@@ -1,12 +1,16 @@
 import struct
-from typing import Any, TypeAlias
+from types import NoneType
+from typing import Any, Callable, TypeAlias
 
-from ..base.types import BaseTypes, BaseValueType, BaseContainerTypesTuple, BaseValueTypes
+from ..base.types import BaseTypes, BaseValueType, BaseContainerTypesTuple, BaseValueTypes, BaseValueTypesTuple
 
 
 __ALLOW_NONE_VALUE__ = True
 __DEFAULT_VALUE__ = None
 
+_NONE_STRINGS: frozenset[str] = frozenset({"None", "Null", "null", "NONE", "NULL", "", " "})
+_EMPTY_CONTAINER_TYPES: tuple[type, ...] = (dict, list, tuple, set, frozenset)
+
 
 def convert_none_to_default_value(value: Any) -> Any:
     """Converts None to default value
@@ -15,18 +19,8 @@ def convert_none_to_default_value(value: Any) -> Any:
         value (Any): The value to convert
     """
     if (value is None or
-        value == "None" or
-        value == "Null" or
-        value == "null" or
-        value == "NONE" or
-        value == "NULL" or
-        value == "" or
-        value == " " or
-        value == {} or
-        value == [] or
-        value == () or
-        value == set() or
-        value == frozenset()
+        (isinstance(value, str) and value in _NONE_STRINGS) or
+        (isinstance(value, _EMPTY_CONTAINER_TYPES) and len(value) == 0)
     ):
         if __ALLOW_NONE_VALUE__:
             return __DEFAULT_VALUE__
@@ -113,8 +107,18 @@ def convert_to_bool(value: Any) -> bool:
         raise TypeError(f"Could not convert {value} to bool")
 
 
+_FORCE_VALUE: dict[type, Callable[[Any], BaseValueType]] = {
+    NoneType: lambda value: None,
+    bool: convert_to_bool,
+    int: convert_to_int,
+    float: convert_to_float,
+    str: convert_to_str,
+    bytes: convert_to_bytes
+}
+
+
 def force_value_type(value: BaseValueType, type_alias: str) -> BaseValueType:
-    assert isinstance(value, BaseValueType), f"Expected a value, but received {type(value)}"
+    assert isinstance(value, BaseValueTypesTuple), f"Expected a value, but received {type(value)}"
     assert isinstance(type_alias, str), f"Expected a string, but received {type(type_alias)}"
 
     if value is None or type_alias == "None":
@@ -126,21 +130,28 @@ def force_value_type(value: BaseValueType, type_alias: str) -> BaseValueType:
     if isinstance(value, type_from_alias):
         return value
 
-    match (str(type_from_alias)):
-        case "<class 'NoneType'>":
-            return None
-        case "<class 'bool'>":
-            return convert_to_bool(value)
-        case "<class 'int'>":
-            return convert_to_int(value)
-        case "<class 'float'>":
-            return convert_to_float(value)
-        case "<class 'str'>":
-            return convert_to_str(value)
-        case "<class 'bytes'>":
-            return convert_to_bytes(value)
-        case _:
-            raise TypeError(f"Could not force value {value} to type {type_alias}")
+    convert = _FORCE_VALUE.get(type_from_alias)
+    if convert is None:
+        raise TypeError(f"Could not force value {value} to type {type_alias}")
+
+    return convert(value)
+
+
+def _tuple_to_dict(container: tuple[Any, ...]) -> dict:
+    """
+    Repackages alternating key, value items into a dict
+    """
+    items = iter(container)
+    return dict(zip(items, items))
+
+
+_CONVERT_TUPLE: dict[type, Callable[[tuple[Any, ...]], Any]] = {
+    list: list,
+    tuple: lambda container: container,
+    set: set,
+    frozenset: frozenset,
+    dict: _tuple_to_dict
+}
 
 
 def convert_tuple(container: tuple[Any, ...], type_alias: str):
@@ -155,20 +166,8 @@ def convert_tuple(container: tuple[Any, ...], type_alias: str):
     type_from_alias: TypeAlias | type = BaseTypes._get_type_from_alias(type_alias)
     assert type_from_alias in BaseContainerTypesTuple, exc_msg
 
-    match (str(type_from_alias)):
-        case("<class 'list'>"):
-            return [value for value in container]
-        case("<class 'tuple'>"):
-            return tuple([value for value in container])
-        case("<class 'set'>"):
-            return {value for value in container}
-        case("<class 'frozenset'>"):
-            return frozenset({value for value in container})
-        case("<class 'dict'>"):
-            keys: tuple[Any, ...] = container[::2]
-            values: tuple[Any, ...] = container[1::2]
-            return {key: value for key, value in zip(keys, values)}
-        case _:
-            raise TypeError(f"Expected a container, but received {type_alias}")
-
+    convert = _CONVERT_TUPLE.get(type_from_alias)
+    if convert is None:
+        raise TypeError(f"Expected a container, but received {type_alias}")
 
+    return convert(container)
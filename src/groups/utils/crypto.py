@@ -1,7 +1,9 @@
-import hashlib
+import functools
+from hashlib import sha256 as _sha256
 from attrs import define, field, validators, Factory, converters
-from typing import Any, Iterable, NamedTuple, Tuple, override, Optional
+from typing import Any, Callable, Iterable, NamedTuple, Tuple, override, Optional
 from .sha256 import SHA256Hash
+from .cache import cache_field, cached_slot
 # from ..base.types import BaseValueType
 
 
@@ -29,43 +31,60 @@ class Leaf:
             raise ValueError(f"Expected hash to be SHA256Hash, got {type(value)}")
 
 
+_TO_LEAF: dict[type, Callable[[Any], Leaf]] = {
+    str: lambda item: Leaf(SHA256Hash.from_str(item)),
+    bytes: lambda item: Leaf(SHA256Hash.from_bytes(item)),
+    SHA256Hash: Leaf,
+    Leaf: lambda item: item
+}
+
+
 def convert_to_leaves(data: Tuple[str | bytes | SHA256Hash | Leaf, ...]) -> Tuple[Leaf, ...]:
-    """Converts a string to bytes
+    """Converts the items to Leaf objects, str and bytes items are hashed
 
     Args:
-        data (str): The string to convert
+        data (Tuple[str | bytes | SHA256Hash | Leaf, ...]): The items to convert
 
     Returns:
-        bytes: The converted string
+        Tuple[Leaf, ...]: The converted items
     """
-    sha256_objects: list[Leaf] = []
+    leaves: list[Leaf] = []
     for item in data:
-        if not isinstance(item, (str, bytes, SHA256Hash, Leaf)):
+        to_leaf: Callable[[Any], Leaf] | None = _TO_LEAF.get(type(item))
+        if to_leaf is None:
             raise ValueError(f"Expected data to be str or bytes, got {type(item)}")
-        if isinstance(item, str):
-            sha256_objects.append(Leaf(SHA256Hash.from_str(item)))
-        if isinstance(item, bytes):
-            sha256_objects.append(Leaf(SHA256Hash.from_bytes(item)))
-        if isinstance(item, SHA256Hash):
-            sha256_objects.append(Leaf(item))
-        if isinstance(item, Leaf):
-            sha256_objects.append(item)
+        leaves.append(to_leaf(item))
 
-    print(f'{sha256_objects=}')
-    # raise ValueError(f"Expected data to be str or bytes or SHA256Hash, got {type(data)}")
-    return tuple(sha256_objects)
+    return tuple(leaves)
 
 
-@define(frozen=True, slots=True)
+@define(frozen=True, slots=True, weakref_slot=False)
 class Leaves:
     """A Leaves object.
     """
 
+    # convert_to_leaves only ever returns a tuple of Leaf objects, so no validator re-checks the items
     leaves: Tuple[Leaf, ...] = field(
         default=tuple(),
-        converter=convert_to_leaves,
-        validator=validators.deep_iterable(validators.instance_of((Leaf)),
-        iterable_validator=validators.instance_of(tuple)))
+        converter=convert_to_leaves)
+
+    _digests: Tuple[bytes, ...] = field(
+        init=False,
+        eq=False,
+        repr=False,
+        default=Factory(lambda self: tuple(leaf.hash.hash for leaf in self.leaves), takes_self=True))
+
+    _digest_set: Optional[frozenset[bytes]] = cache_field()
+    _hash_value: Optional[int] = cache_field()
+
+    @property
+    def digests(self) -> Tuple[bytes, ...]:
+        """The raw 32 byte digests of the leaves, unwrapped once on construction
+
+        Returns:
+            Tuple[bytes, ...]: The raw digests
+        """
+        return self._digests
     
     def __add__(self, other: 'Leaves') -> 'Leaves':
         return Leaves(self.leaves + other.leaves)
@@ -77,6 +96,22 @@ class Leaves:
     
     def __len__(self) -> int:
         return len(self.leaves)
+
+    def __contains__(self, item: bytes | SHA256Hash | Leaf) -> bool:
+        if isinstance(item, Leaf):
+            item = item.hash
+        if isinstance(item, SHA256Hash):
+            item = item.hash
+
+        return item in self._get_digest_set()
+
+    @cached_slot("_digest_set")
+    def _get_digest_set(self) -> frozenset[bytes]:
+        return frozenset(self._digests)
+
+    @cached_slot("_hash_value")
+    def __hash__(self) -> int:
+        return hash(self._digests)
     
     def __iter__(self) -> Iterable[Leaf]:
         return iter(self.leaves)
@@ -87,24 +122,15 @@ class Leaves:
 
 
 def convert_loose_leaves_to_levels(data: Tuple[SHA256Hash, ...] | Tuple[str, ...] | Tuple[bytes, ...]) -> Leaves:
-    leaf_hashes: list[SHA256Hash] = []
     if isinstance(data, tuple):
         if len(data) == 0:
             return None
-        for item in data:
-            if not isinstance(item, (SHA256Hash, str, bytes)):
-                raise ValueError(f"Expected data to be str or bytes, got {type(item)}")
-            if isinstance(item, str):
-                leaf_hashes.append(SHA256Hash.from_str(item))
-            if isinstance(item, bytes):
-                leaf_hashes.append(SHA256Hash.from_bytes(item))
-            if isinstance(item, SHA256Hash):
-                leaf_hashes.append(item)
-            
-        return Leaves(tuple(leaf_hashes))
+
+        # The Leaves converter checks and hashes the items, so they are only converted once
+        return Leaves(data)
     
 
-@define(slots=True)
+@define(slots=True, weakref_slot=False)
 class Levels:
     """A Level object.
     """
@@ -136,25 +162,11 @@ class Levels:
             self.append(leaves)
         return self
 
-def convert_tuple_to_levels(data: Tuple[SHA256Hash, ...] | Tuple[str, ...] | Tuple[bytes, ...]) -> Levels:
-    leaf_hashes: list[SHA256Hash] = []
-    if isinstance(data, tuple):
-        if len(data) == 0:
-            return None
-        for item in data:
-            if not isinstance(item, (SHA256Hash, str, bytes)):
-                raise ValueError(f"Expected data to be str or bytes, got {type(item)}")
-            if isinstance(item, str):
-                leaf_hashes.append(SHA256Hash.from_str(item))
-            if isinstance(item, bytes):
-                leaf_hashes.append(SHA256Hash.from_bytes(item))
-            if isinstance(item, SHA256Hash):
-                leaf_hashes.append(item)
-            
-        return Levels(tuple(leaf_hashes))
-
-
-@define(slots=True)
+# Leaves is frozen, so every tree built without data shares one empty instance
+_EMPTY_LEAVES: Leaves = Leaves(tuple())
+
+
+@define(slots=True, weakref_slot=False, init=False)
 class MerkleTree:
     """A Merkle Tree object.
     """
@@ -169,84 +181,80 @@ class MerkleTree:
         # converter=convert_loose_leaves_to_levels,
         validator=validators.optional(validators.instance_of(Leaves)))
     
-    _levels: Optional[Levels | Tuple[Leaves, ...]] = field(
-        default=None,
-        converter=convert_tuple_to_levels,
-        validator=validators.optional(validators.instance_of(Levels | tuple)))
+    _levels: Tuple[Tuple[bytes, ...], ...] = field(
+        default=tuple(),
+        validator=validators.instance_of(tuple))
 
-    def __init__(self, hashed_data: Tuple[SHA256Hash, ...] | Tuple[str, ...] | Tuple[bytes, ...] | Leaves = (), use_all_bytes: bool = True) -> None:
-        self.leaves = hashed_data if isinstance(hashed_data, Leaves) else convert_loose_leaves_to_levels(hashed_data)
-        
-        if self.leaves is None:
-            self.leaves = Leaves(tuple())
-        _levels = Levels((self.leaves, ))
-        print(f'{_levels=}')
-        # self.levels = _levels
-        self._levels = _levels
-        print(f'{self._levels=}')
-        self.build()
-
-    # def build(self) -> None:
-
-    def build(self) -> None:
-        if self._levels is None:
+    # Set once by build, the levels are not changed afterwards
+    _root: Optional[bytes] = field(default=None)
+
+    def __init__(self, hashed_data: Tuple[SHA256Hash, ...] | Tuple[str, ...] | Tuple[bytes, ...] | Leaves = (), use_all_bytes: bool = True, store_levels: bool = True) -> None:
+        leaves: Leaves | None = hashed_data if isinstance(hashed_data, Leaves) else convert_loose_leaves_to_levels(hashed_data)
+
+        self.leaves = leaves if leaves is not None else _EMPTY_LEAVES
+        self.build(store_levels)
+
+    def build(self, store_levels: bool = True) -> None:
+        """Builds the levels of the tree bottom up from the raw leaf digests
+
+        The levels are collected in a list and stored as a tuple once, a single leaf is paired with itself so every
+        tree with leaves has a hashed root level.
+
+        Args:
+            store_levels (bool): Whether every level is kept, otherwise only the root level is kept and each level is
+                released once the level above it is hashed. Defaults to True.
+        """
+        level: Tuple[bytes, ...] = self.leaves.digests
+        if len(level) == 0:
+            self._levels = ()
+            self._root = None
             return None
 
-        level = self._levels
+        levels: list[Tuple[bytes, ...]] = [level]
+        level = self.hash_level(level)
 
-        if len(self._levels) == 1:
-            self._levels = self._levels.levels + (self._hash_items(self._levels.levels), )
         while len(level) > 1:
-            hashed_level = self.hash_level(level)
-            self._levels = self._levels + (hashed_level, )
+            if store_levels:
+                levels.append(level)
+            level = self.hash_level(level)
 
-            level = (hashed_level, )
+        self._levels = tuple(levels) + (level, ) if store_levels else (level, )
+        self._root = level[0]
+
+    @classmethod
+    def root_only(cls, hashed_data: Tuple[SHA256Hash, ...] | Tuple[str, ...] | Tuple[bytes, ...] | Leaves = ()) -> bytes | None:
+        """Computes the raw root digest without keeping the levels below it
+
+        Args:
+            hashed_data (Tuple[SHA256Hash, ...] | Tuple[str, ...] | Tuple[bytes, ...] | Leaves): The leaves of the tree
+
+        Returns:
+            bytes | None: The raw root digest, None if there are no leaves
+        """
+        return cls(hashed_data, store_levels=False).raw_root
 
     def __add__(self, other: 'MerkleTree') -> 'MerkleTree':
         return MerkleTree(self.leaves + other.leaves)
 
     @staticmethod
-    def _hash_func(data:  str | bytes | tuple | SHA256Hash) -> bytes:
-        """Hashes a string using SHA256
+    def _hash_func(data: str | bytes) -> bytes:
+        """Hashes str or bytes using SHA256
 
         Args:
-            data (str): The string to hash
+            data (str | bytes): The data to hash, str is utf-8 encoded first
         
         Returns:
-            str: The hashed string
-        """
-        # possible_multiple_data_items = MerkleTree._hash_func_iter(data)
+            bytes: The raw 32 byte digest
 
-        for item in MerkleTree._hash_func_iter(data):
-            print(f'{item=}')
-            return item
-
-    @staticmethod
-    def _hash_func_iter(data: str | bytes | tuple | SHA256Hash | Leaves) -> Iterable[bytes]:
-        if isinstance(data, str):
-            yield SHA256Hash.from_str(data).hash
-        
+        Raises:
+            ValueError: If data is not str or bytes
+        """
         if isinstance(data, bytes):
-            yield SHA256Hash.from_bytes(data).hash
-        
-        if isinstance(data, tuple):
-            for item in data:
-                if isinstance(item, str):
-                    yield SHA256Hash.from_str(item).hash
-                
-                if isinstance(item, bytes):
-                    yield SHA256Hash.from_bytes(item).hash
-                
-                if isinstance(item, SHA256Hash):
-                    yield item.hash
-
-        if isinstance(data, Leaves):
-            for item in data.leaves:
-                yield item.hash.hash
-                
-                raise ValueError(f"Expected data to be str or bytes, or SHA256Hash, got {type(item)}")
-        
-        # raise ValueError(f"Expected data to be str or bytes or tuple, got {type(data)}")
+            return _sha256(data).digest()
+        if isinstance(data, str):
+            return _sha256(data.encode()).digest()
+
+        raise ValueError(f"Expected data to be str or bytes, got {type(data)}")
 
     @staticmethod
     def _hash_items(item1: bytes | None = None, item2: bytes | None = None) -> bytes:
@@ -255,32 +263,68 @@ class MerkleTree:
             raise ValueError(f'item1 cannot be None, but received {type(item1)})')
 
         if item2 is None:
-            return MerkleTree._hash_items(item1, item1)
+            item2 = item1
+
+        # Pair hashes are always two raw digests, both are fed to one hasher without building a 64 byte concatenation
+        pair_hash = _sha256(item1)
+        pair_hash.update(item2)
+        return pair_hash.digest()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _hash_self(item: bytes) -> bytes:
+        """Hashes a digest paired with itself, the odd last node of a level
 
-        return MerkleTree._hash_func(item1 + item2)
+        Single leaf trees are built for every hashed value, so the results for recurring digests are cached.
+
+        Args:
+            item (bytes): The raw digest
+
+        Returns:
+            bytes: The raw digest of the digest concatenated with itself
+        """
+        return _sha256(item * 2).digest()
 
     @staticmethod
-    def hash_level(level: tuple[str | bytes, ...]) -> tuple[str, ...]:
-        hashed_level = ()
-        for i in range(0, len(level), 2):
-            if (i + 1) % 2 != 0 and i == len(level) - 1:
-                hashed_level = hashed_level + (MerkleTree._hash_items(level[i]), )
-            elif (i + 1 <= len(level) - 1):
-                hashed_level = hashed_level + (MerkleTree._hash_items(level[i], level[i + 1]), )
-            else:
-                raise Exception("This should never happen")
-
-        return hashed_level
+    def hash_level(level: tuple[bytes, ...]) -> tuple[bytes, ...]:
+        """Hashes a level of the tree into the level above it
+
+        The whole level is hashed in one map over its even and odd slices, an odd last digest is paired with itself.
+
+        Args:
+            level (tuple[bytes, ...]): The raw digests of the level
+
+        Returns:
+            tuple[bytes, ...]: The raw digests of the level above
+        """
+        hashed_level: list[bytes] = list(map(MerkleTree._hash_items, level[0::2], level[1::2]))
+        if len(level) % 2 != 0:
+            hashed_level.append(MerkleTree._hash_self(level[-1]))
+
+        return tuple(hashed_level)
 
     def _find_levels_count(self) -> int:
         return len(self._levels)
     
+    @property
+    def raw_root(self) -> bytes | None:
+        """The root digest of the tree as raw bytes
+
+        Digests are kept as raw 32 byte values inside the tree, only root converts to hex.
+
+        Returns:
+            bytes | None: The root digest, None if the tree has no leaves
+        """
+        return self._root
+
     @property
     def root(self) -> str | None:
-        if not self._levels or len(self._levels) == 0:
-            return None
-        if self._levels.levels is None or len(self._levels.levels) == 0 or len(self.leaves.leaves) == 0:
-            return None
+        """The root digest of the tree as a hex string
+
+        Returns:
+            str | None: The hex root digest, None if the tree has no leaves
+        """
+        return self._root.hex() if self._root is not None else None
 
     def verify(self, leaf_hash: str | bytes) -> bool:
         if leaf_hash not in self.leaves:
@@ -1,5 +1,4 @@
-import hashlib
-import re
+from hashlib import sha256 as _sha256
 from attrs import define, field, Factory
 from typing import Any, Iterable, overload, override
 
@@ -32,20 +31,14 @@ class SHA256Hash:
 
     @_raw_hash.validator
     def _check_hash(self, attribute, value):
-        if not isinstance(value, (str, bytes)):
+        # The converter has already turned str into bytes, and any 32 raw bytes are a valid digest
+        if not isinstance(value, bytes):
             raise ValueError(f"Expected hash to be str or bytes, got {type(value)}")
-        
-        if value in [None, '', ' ', b'', b' ']:
-            raise ValueError("Expected hash to be not None or empty string")
-        
-        if isinstance(value, str):
-            value = value.encode()
 
         if len(value) != 32:
+            if value in (b'', b' '):
+                raise ValueError("Expected hash to be not None or empty string")
             raise ValueError("Expected hash to be 32 bytes")
-        
-        if not re.match(r'^[0-9a-fA-F]+$', value.hex()):
-            raise ValueError("Expected hash to be hex")
 
     @property
     def hash(self) -> bytes:
@@ -70,7 +63,7 @@ class SHA256Hash:
             str: The hashed string
         """
         if isinstance(data, bytes):
-            return cls(hashlib.sha256(data).digest())
+            return cls(_sha256(data).digest())
         
         raise ValueError(f"Expected data to be bytes, got {type(data)}")
 
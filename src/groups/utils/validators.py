@@ -1,9 +1,12 @@
-from types import NoneType
-from typing import Any
-from ..base.types import BaseValueType, LinearContainer, NamedContainer, BaseContainerType
+from typing import Any, get_args
+from ..base.types import LinearContainer, NamedContainer, BaseValueTypesTuple, BaseContainerTypesTuple
 from ..base.exceptions import GroupBaseValueException
 
 
+# isinstance() against a typing.Union is resolved on every call, plain tuples are checked in C
+_LINEAR_CONTAINER_TYPES: tuple[type, ...] = get_args(LinearContainer)
+
+
 def _is_base_value_type(item: Any) -> bool:
     """
     Checks if item is a base value
@@ -11,7 +14,7 @@ def _is_base_value_type(item: Any) -> bool:
     Args:
         item (BaseValueTypes): The item to check
     """
-    return isinstance(item, BaseValueType)
+    return isinstance(item, BaseValueTypesTuple)
 
 
 def validate_base_value_type(instance, attribute, value) -> None:
@@ -33,14 +36,14 @@ def is_base_container_type(item: Any) -> bool:
     """
     Checks if item is a base container
     """
-    return isinstance(item, BaseContainerType)
+    return isinstance(item, BaseContainerTypesTuple)
 
 
 def is_linear_container(item: Any) -> bool:
     """
     Checks if item is a linear container
     """
-    return isinstance(item, LinearContainer)
+    return isinstance(item, _LINEAR_CONTAINER_TYPES)
 
 
 def is_named_container(item: Any) -> bool:
@@ -57,11 +60,9 @@ def contains_sub_container(item: Any) -> bool:
     # assert is_base_container_type(item), f"Expected a container, but received a non-container {item}"
 
     if is_linear_container(item):
-        for value in item:
-            return is_base_container_type(value)
+        return any(is_base_container_type(value) for value in item)
 
     elif is_named_container(item):
-        for value in item.values():
-            return is_base_container_type(value)
+        return any(is_base_container_type(value) for value in item.values())
 
     return False
\ No newline at end of file
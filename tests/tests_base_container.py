@@ -2,7 +2,8 @@ import unittest
 import sys
 
 sys.path.append("../forme-groups-python-3-12/")
-from src.groups.base.container import BaseContainer, contains_sub_container
+from src.groups.base.container import BaseContainer
+from src.groups.utils.validators import contains_sub_container
 from src.groups.base.value import BaseValue
 from src.groups.base.exceptions import GroupBaseContainerException
 
@@ -65,4 +65,14 @@ class TestBaseSchema(unittest.TestCase):
         self.assertEqual(BaseSchema._from_dict({'entries': [{'key': 'name', 'value': 'str'}, {'key': 'age', 'value': 'int'}]}), self.schema_base_one)
 
     def test_schema_from_dict_no_schema_entries(self):
-        self.assertRaises(KeyError, BaseSchema._from_dict, {'bad_entries': [{'key': 'name', 'value': 'str'}, {'key': 'age', 'value': 'int'}]})
\ No newline at end of file
+        self.assertRaises(KeyError, BaseSchema._from_dict, {'bad_entries': [{'key': 'name', 'value': 'str'}, {'key': 'age', 'value': 'int'}]})
+
+    def test_schema_get_entry(self):
+        self.assertIs(self.schema_base_one.get_entry("name"), self.schema_entry_one)
+        self.assertIs(self.schema_base_one.get_entry("age"), self.schema_entry_two)
+        self.assertRaises(KeyError, self.schema_base_one.get_entry, "missing")
+        self.assertEqual(self.schema_base_one, BaseSchema((self.schema_entry_one, self.schema_entry_two)))
+
+    def test_schema_hash_entries(self):
+        hashed_entries = self.schema_base_one._hash_entries()
+        self.assertEqual(hashed_entries.root, "4a955bb8f8fdfb0b73c5b687c04273026907d2db592119f8914f6f31f7ddec41")
@@ -1,8 +1,11 @@
+import copy
+import os
+import subprocess
 import unittest
 import sys
 
 sys.path.append("../forme-groups-python-3-12/")
-from src.groups.base.types import BaseTypes
+from src.groups.base.types import BaseTypes, BaseType, _BaseTypes
 from src.groups.base.exceptions import GroupBaseTypeException
 
 class TestBaseTypes(unittest.TestCase):
@@ -17,6 +20,23 @@ class TestBaseTypes(unittest.TestCase):
 
         self.assertTrue(self.system_pool._validate_types())
 
+    def test_type_pool_validate_types_duplicate_alias(self):
+        bytes_type = BaseType(aliases=("Bytes", "Integer"), super_type="__SYSTEM_RESERVED_BYTES__", type_class=bytes)
+        self.assertRaises(GroupBaseTypeException, _BaseTypes(Bytes=bytes_type)._validate_types)
+
+    def test_type_pool_validate_types_duplicate_type_class(self):
+        bytes_type = BaseType(aliases=("Bytes", ), super_type="__SYSTEM_RESERVED_BYTES__", type_class=str)
+        self.assertRaises(GroupBaseTypeException, _BaseTypes(Bytes=bytes_type)._validate_types)
+
+    def test_system_type_pool_validate_no_substring_aliases(self):
+        self.assertTrue(self.system_pool._validate_no_substring_aliases(exclude=("int", "INT", "Set", "set", "SET")))
+        # "int" sits inside "FloatingPoint" and "Set" inside "FrozenSet", so Integer and Set are only valid when excluded
+        self.assertRaises(GroupBaseTypeException, self.system_pool._validate_no_substring_aliases)
+
+    def test_type_pool_validate_types_substring_alias(self):
+        bytes_type = BaseType(aliases=("Bytes", "Flo"), super_type="__SYSTEM_RESERVED_BYTES__", type_class=bytes)
+        self.assertRaises(GroupBaseTypeException, _BaseTypes(Bytes=bytes_type)._validate_types)
+
     def test_system_type_pool_all(self):
 
         self.assertEqual(self.system_pool.all(), int | float | bool | str | bytes | dict | list | tuple | set | frozenset | None)
@@ -42,4 +62,51 @@ class TestBaseTypes(unittest.TestCase):
     def test_system_base_type_interface_hash_public(self):
 
         integer = self.system_pool.Integer
-        self.assertEqual(integer._hash_public_slots().root(), "e87c23c3af923f131a1f85996611d5a7a932832e04d83c2ad2ab831b572f2618")
\ No newline at end of file
+        self.assertEqual(integer._hash_public_slots().root(), "e87c23c3af923f131a1f85996611d5a7a932832e04d83c2ad2ab831b572f2618")
+
+    def test_system_base_type_separators(self):
+        self.assertEqual(self.system_pool.Dictionary.separators, (",", " ,", ", ", " , "))
+        self.assertEqual(self.system_pool.Integer.separators, ())
+        self.assertTrue(self.system_pool.List._contains("separator", ", "))
+        self.assertEqual(tuple(self.system_pool.List.__iter_slots__(True, True)), ("_encryption_key", ))
+
+    def test_base_type_identity_equality(self):
+        integer = self.system_pool.Integer
+        integer_copy = copy.copy(integer)
+        self.assertEqual(integer, integer)
+        self.assertNotEqual(integer, integer_copy)
+        self.assertNotEqual(BaseType(aliases=("Example", )), BaseType(aliases=("Example", )))
+
+        self.assertIn(integer, {integer})
+        self.assertNotIn(integer_copy, {integer})
+        self.assertEqual({integer: "int"}[integer], "int")
+        self.assertEqual(hash(integer), hash(integer))
+
+    def test_system_type_pool_identity_equality(self):
+        self.assertEqual(self.system_pool, BaseTypes)
+        self.assertNotEqual(self.system_pool, _BaseTypes())
+        self.assertIn(self.system_pool, {self.system_pool})
+        self.assertIs(_BaseTypes().Integer, self.system_pool.Integer)
+
+    def test_base_type_package_root_is_cached(self):
+        base_type = BaseType(aliases=("Example", "example"))
+        self.assertIsNone(base_type._hash_package_root)
+
+        package_root = base_type._package_root()
+        self.assertEqual(package_root, base_type._hash_package().root)
+        self.assertIs(base_type._hash_package_root, package_root)
+        self.assertIs(base_type._package_root(), package_root)
+        self.assertEqual(len(self.system_pool._hash_types().root), 64)
+
+    def test_system_base_type_hash_is_stable_across_processes(self):
+        # Set reprs follow the hash seed, so a set held in a slot would change the hash from one process to the next
+        package_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        script = "from src.groups.base.types import BaseTypes; print(BaseTypes.Dictionary._hash_tree().root)"
+
+        roots = set()
+        for seed in ("1", "2", "3"):
+            env = dict(os.environ, PYTHONHASHSEED=seed, PYTHONPATH=package_path)
+            result = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True, check=True)
+            roots.add(result.stdout.strip())
+
+        self.assertEqual(roots, {self.system_pool.Dictionary._hash_tree().root})
@@ -9,6 +9,7 @@ from src.groups.base.schema import BaseSchema, SchemaEntry
 from src.groups.unit.nonce import Nonce
 from src.groups.unit.data import Data
 from src.groups.controller import Controller
+from src.groups.pool import Pool
 
 
 class TestController(unittest.TestCase):
@@ -35,4 +36,23 @@ class TestController(unittest.TestCase):
 
     def test_controller_add_data_nonce(self):
         self.assertEqual(self.controller.active.nonce._hash().root(), '3eff7c5314a5ed2d5d8fdad16bbc4851cd98b9861c950854246318c5576a37fd')
-        self.assertEqual(self.controller.active.nonce, self.defualt_nonce)
\ No newline at end of file
+        self.assertEqual(self.controller.active.nonce, self.defualt_nonce)
+
+
+class TestControllerInit(unittest.TestCase):
+    def test_controller_default_pool(self):
+        controller = Controller()
+        self.assertIsInstance(controller.pool, Pool)
+        self.assertEqual(len(controller.pool.group_units), 1)
+        self.assertIs(controller.active, controller.pool.group_units[-1][2])
+
+    def test_controller_none_pool(self):
+        controller = Controller(None)
+        self.assertIsInstance(controller.pool, Pool)
+        self.assertEqual(controller.active, Controller().active)
+
+    def test_controller_given_pool(self):
+        pool = Controller().pool
+        controller = Controller(pool)
+        self.assertIs(controller.pool, pool)
+        self.assertIs(controller.active, pool.group_units[-1][2])
@@ -28,4 +28,8 @@ class TestData(unittest.TestCase):
         self.assertEqual(data_no_schema.entry, self.data_real.entry)
 
     def test_data_creation_str(self):
-        self.assertEqual(str(self.data_real), f"entry: ('test_user', 31), schema: None")
\ No newline at end of file
+        self.assertEqual(str(self.data_real), f"entry: ('test_user', 31), schema: None")
+
+    def test_data_from_dict_without_schema(self):
+        produced_data = Data._from_dict_without_schema(self.data_real._to_dict_without_schema())
+        self.assertEqual(produced_data, self.data_real)
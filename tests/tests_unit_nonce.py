@@ -76,4 +76,10 @@ class TestUnitNonce(unittest.TestCase):
 
     def test_from_dict(self):
         nonce_dict: dict = {'chain': {'items': [{'value': 0, 'type': 'int'}], 'type': 'tuple'}}
-        self.assertEqual(Nonce._from_dict(nonce_dict), self.nonce)
\ No newline at end of file
+        self.assertEqual(Nonce._from_dict(nonce_dict), self.nonce)
+
+    def test_hash_nonce_units(self):
+        nonce_two = Nonce(BaseContainer((0, 1), "tuple"))
+        self.assertEqual(nonce_two._hash_nonce_units(), (
+            '0cec0f0ba376ea935ef3e8e222a54bc9a934c6ea1180e9455cba8f588b315885',
+            '6ef1119ddbe60d60ce522339c15b94daf1bed3217729c400cf9f02be4ffad619'))
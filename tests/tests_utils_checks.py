@@ -107,3 +107,7 @@ class TestChecks(unittest.TestCase):
         self.assertTrue(contains_sub_container({"key": {"key": {"key": {"key": {"key": {"key": {"key": {"key": "value"}}}}}}}}))
         self.assertTrue(contains_sub_container({"key": {"key": {"key": {"key": {"key": {"key": {"key": {"key": {"key": "value"}}}}}}}}}))
 
+    def test_contains_sub_container_after_first_item(self):
+        self.assertTrue(contains_sub_container((1, 2, [3, 4, 5])))
+        self.assertTrue(contains_sub_container({"key": "value", "key2": {"key": "value"}}))
+
@@ -121,6 +121,12 @@ class TestMerkleTree(unittest.TestCase):
         hash_test_func2 = MerkleTree._hash_func("test2")
         self.assertNotEqual(hash_test_func.hex(), hash_test_func2.hex())
 
+    def test_root_only(self):
+        hashed_data = (b"test", b"test2", b"test3")
+        mt = MerkleTree(hashed_data)
+        self.assertEqual(MerkleTree.root_only(hashed_data), mt.raw_root)
+        self.assertEqual(len(MerkleTree(hashed_data, store_levels=False)._levels), 1)
+
     # def test_hash_items_identical_single(self):
     #     hash_test_func = MerkleTree._hash_func("test")
     #     hashed_items = MerkleTree._hash_items(hash_test_func)